@@ -0,0 +1,68 @@
+__all__ = ['BlockingResolver', 'blocking_resolver']
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
+from contextvars import copy_context
+from functools import update_wrapper
+from typing import Optional, Protocol, TypeVar, Union, overload
+
+from atgql.pyutils.promise_or_value import PromiseOrValue
+
+R = TypeVar('R')
+R_co = TypeVar('R_co', covariant=True)  # pylint: disable=invalid-name
+
+
+class BlockingResolver(Protocol[R_co]):
+    # The arguments are typed as object rather than Any, so that the functions decorated
+    # with `blocking_resolver` pass mypy's disallow_any_decorated.
+    def __call__(self, *args: object, **kwargs: object) -> PromiseOrValue[R_co]:
+        ...
+
+
+@overload
+def blocking_resolver(fn: Callable[..., R], /) -> BlockingResolver[R]:
+    ...
+
+
+@overload
+def blocking_resolver(
+    *, executor: Optional[Executor] = None
+) -> Callable[[Callable[..., R]], BlockingResolver[R]]:
+    ...
+
+
+def blocking_resolver(
+    fn: Optional[Callable[..., R]] = None, /, *, executor: Optional[Executor] = None
+) -> Union[BlockingResolver[R], Callable[[Callable[..., R]], BlockingResolver[R]]]:
+    """Marks a synchronous resolver as blocking, so that it runs in a thread pool.
+
+    When called inside a running event loop, the decorated resolver is run by
+    `executor` (the loop's default `ThreadPoolExecutor` if omitted) and an awaitable
+    of its result is returned, so the event loop and sibling fields are not stalled
+    while it blocks. The context variables of the caller are visible in the thread.
+
+    Without a running event loop the resolver is just called, because there is
+    nothing else to keep running.
+    """
+
+    def decorator(resolver: Callable[..., R]) -> BlockingResolver[R]:
+        def offloaded(*args: object, **kwargs: object) -> PromiseOrValue[R]:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return resolver(*args, **kwargs)
+
+            context = copy_context()
+
+            def run_in_context() -> R:
+                return context.run(resolver, *args, **kwargs)
+
+            return loop.run_in_executor(executor, run_in_context)
+
+        return update_wrapper(offloaded, resolver)
+
+    if fn is not None:
+        return decorator(fn)
+
+    return decorator
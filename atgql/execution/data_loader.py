@@ -0,0 +1,218 @@
+__all__ = ['BatchLoadFn', 'DataLoader']
+
+import asyncio
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Final, Generic, Optional, TypeVar, Union, cast
+
+from atgql.pyutils.inspect_ import inspect
+from atgql.shims import Promise
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+BatchLoadFn = Callable[[list[K]], Promise[Sequence[Union[V, Exception]]]]
+
+
+class _Batch(Generic[K, V]):
+    keys: list[K]
+    futures: list['asyncio.Future[V]']
+
+    def __init__(self) -> None:
+        self.keys = []
+        self.futures = []
+
+
+class DataLoader(Generic[K, V]):
+    """Batches and caches loads of keys within a single event loop iteration.
+
+    Every key passed to `load()` during one iteration of the event loop is
+    collected into one batch, and `batch_load_fn` is called once with all of
+    them when the loop gets to run its next callbacks. This turns the N+1 loads
+    issued by the items of a list field into a single call to the backend.
+
+    `batch_load_fn` must resolve to a sequence of the same length as the keys,
+    where each item is either the value for the key at the same index or an
+    `Exception` instance which is raised to the loader of that key only.
+
+    Loaded values are cached by key, so a `DataLoader` is meant to be created
+    per request and discarded afterwards, instead of living as long as the schema.
+    """
+
+    _max_batch_size: Optional[int]
+    _cache: Optional[dict[Hashable, 'asyncio.Future[V]']]
+    _batch: Optional[_Batch[K, V]]
+    # The event loop only keeps weak references to tasks, so the pending ones are held here.
+    _pending_tasks: set['asyncio.Task[None]']
+
+    def __init__(
+        self,
+        batch_load_fn: BatchLoadFn[K, V],
+        *,
+        cache: bool = True,
+        max_batch_size: Optional[int] = None,
+        cache_key_fn: Optional[Callable[[K], Hashable]] = None,
+    ) -> None:
+        if not callable(batch_load_fn):
+            raise TypeError(
+                'DataLoader must be constructed with a function which accepts list[key] '
+                'and returns Promise[Sequence[value]], '
+                f'but got: {inspect(batch_load_fn)}.'
+            )
+
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(
+                f'max_batch_size must be a positive number: {inspect(max_batch_size)}.'
+            )
+
+        if cache_key_fn is None:
+            cache_key_fn = _default_cache_key_fn
+
+        # Declared here rather than on the class, where mypy would take them for methods.
+        self._batch_load_fn: Final[BatchLoadFn[K, V]] = batch_load_fn
+        self._cache_key_fn: Final[Callable[[K], Hashable]] = cache_key_fn
+        self._max_batch_size = max_batch_size
+        self._cache = {} if cache else None
+        self._batch = None
+        self._pending_tasks = set()
+
+    def load(self, key: K) -> 'asyncio.Future[V]':
+        """Loads a key, returning a future for the value represented by that key.
+
+        Every call returns its own future, so cancelling it, e.g. when the field
+        which awaits it is abandoned, does not affect other loads of the same key.
+        """
+
+        cache_key: Final = self._cache_key_fn(key)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None and not cached.cancelled():
+                return asyncio.shield(cached)
+
+        batch: Final = self._get_current_batch()
+        future: Final['asyncio.Future[V]'] = asyncio.get_running_loop().create_future()
+        batch.keys.append(key)
+        batch.futures.append(future)
+
+        if self._cache is not None:
+            self._cache[cache_key] = future
+
+        return asyncio.shield(future)
+
+    def load_many(self, keys: Iterable[K]) -> 'asyncio.Future[list[V]]':
+        """Loads multiple keys, returning a future for the list of their values."""
+
+        return asyncio.gather(*(self.load(key) for key in keys))
+
+    def clear(self, key: K) -> 'DataLoader[K, V]':
+        """Clears the value at `key` from the cache, if it exists."""
+
+        if self._cache is not None:
+            self._cache.pop(self._cache_key_fn(key), None)
+        return self
+
+    def clear_all(self) -> 'DataLoader[K, V]':
+        """Clears the entire cache."""
+
+        if self._cache is not None:
+            self._cache.clear()
+        return self
+
+    def prime(self, key: K, value: Union[V, Exception]) -> 'DataLoader[K, V]':
+        """Primes the cache with the provided key and value.
+
+        If the key already exists, no change is made.
+        To forcefully prime the cache, clear the key first:
+        `loader.clear(key).prime(key, value)`.
+        """
+
+        if self._cache is not None:
+            cache_key: Final = self._cache_key_fn(key)
+            if cache_key not in self._cache:
+                future: Final['asyncio.Future[V]'] = asyncio.get_running_loop().create_future()
+                if isinstance(value, Exception):
+                    future.set_exception(value)
+                    # A primed error is only reported to loaders of the key.
+                    future.add_done_callback(_retrieve_exception)
+                else:
+                    future.set_result(value)
+                self._cache[cache_key] = future
+        return self
+
+    def _get_current_batch(self) -> _Batch[K, V]:
+        existing_batch: Final = self._batch
+        if existing_batch is not None and (
+            self._max_batch_size is None or len(existing_batch.keys) < self._max_batch_size
+        ):
+            return existing_batch
+
+        new_batch: Final[_Batch[K, V]] = _Batch()
+        self._batch = new_batch
+        asyncio.get_running_loop().call_soon(self._dispatch_batch, new_batch)
+        return new_batch
+
+    def _dispatch_batch(self, batch: _Batch[K, V]) -> None:
+        if self._batch is batch:
+            self._batch = None
+
+        try:
+            batch_promise = self._batch_load_fn(batch.keys)
+        except Exception as error:  # pylint: disable=broad-except
+            self._fail_batch(batch, error)
+            return
+
+        task: Final = asyncio.ensure_future(self._resolve_batch(batch, batch_promise))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    async def _resolve_batch(
+        self, batch: _Batch[K, V], batch_promise: Promise[Sequence[Union[V, Exception]]]
+    ) -> None:
+        try:
+            values = await batch_promise
+        except Exception as error:  # pylint: disable=broad-except
+            self._fail_batch(batch, error)
+            return
+
+        if not isinstance(values, Sequence) or len(values) != len(batch.keys):
+            self._fail_batch(
+                batch,
+                TypeError(
+                    'DataLoader must be constructed with a function which accepts '
+                    'list[key] and returns Promise[Sequence[value]], but the function did '
+                    'not return a Promise of a Sequence of the same length as the keys.\n\n'
+                    f'Keys:\n{inspect(batch.keys)}\n\nValues:\n{inspect(values)}'
+                ),
+            )
+            return
+
+        for key, future, value in zip(batch.keys, batch.futures, values):
+            if future.done():
+                self._uncache(key, future)
+            elif isinstance(value, Exception):
+                # Do not cache individual loading failures, the next load retries them.
+                self._uncache(key, future)
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+    def _fail_batch(self, batch: _Batch[K, V], error: Exception) -> None:
+        for key, future in zip(batch.keys, batch.futures):
+            self._uncache(key, future)
+            if not future.done():
+                future.set_exception(error)
+
+    def _uncache(self, key: K, future: 'asyncio.Future[V]') -> None:
+        # Only drop the entry of this load, the key may have been primed again meanwhile.
+        if self._cache is not None:
+            cache_key: Final = self._cache_key_fn(key)
+            if self._cache.get(cache_key) is future:
+                del self._cache[cache_key]
+
+
+def _default_cache_key_fn(key: object) -> Hashable:
+    # Unhashable keys fail as soon as they are looked up in the cache.
+    return cast(Hashable, key)
+
+
+def _retrieve_exception(future: 'asyncio.Future') -> None:
+    future.exception()
@@ -0,0 +1,223 @@
+__all__ = ['MapAsyncIterator', 'map_async_iterator']
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import Final, Generic, Optional, TypeVar, Union, cast
+
+from atgql.pyutils.inspect_ import inspect
+from atgql.pyutils.is_async_iterable import is_async_iterable
+from atgql.pyutils.is_promise import is_promise
+from atgql.pyutils.promise_or_value import PromiseOrValue
+from atgql.shims import Promise
+
+T = TypeVar('T')
+U = TypeVar('U')
+
+
+class _EndType:
+    ...
+
+
+_end: Final = _EndType()
+
+_Result = Union['asyncio.Future[U]', _EndType]
+
+
+class MapAsyncIterator(Generic[T, U]):
+    """An async iterator which yields the values of `iterable` mapped through `callback`.
+
+    Up to `concurrency` values are pulled from the source and mapped at the same
+    time, while the mapped values are still yielded in the order of the source.
+    Once `concurrency` mapped values are waiting for the consumer, the source is
+    no longer pulled until the consumer takes the next one, so a slow consumer
+    applies backpressure to the source instead of letting results pile up.
+
+    If `timeout` is given, a value whose mapping takes longer than `timeout` seconds
+    is cancelled and fails with `asyncio.TimeoutError`, so that a single slow value
+    cannot hold its slot, and with it the source, forever.
+
+    If the source or the callback raises, the values before it are yielded first,
+    then the source is closed and the error is raised to the consumer.
+    """
+
+    _iterator: AsyncIterator[T]
+    _concurrency: int
+    _timeout: Optional[float]
+    _slots: Optional[asyncio.Semaphore]
+    _results: Optional['asyncio.Queue[_Result[U]]']
+    # The value to yield next, it stays here until it is done and handed to the consumer.
+    _head: Optional['asyncio.Future[U]']
+    _pump_task: Optional['asyncio.Task[None]']
+    _is_closed: bool
+
+    def __init__(
+        self,
+        iterable: AsyncIterable[T],
+        callback: Callable[[T], PromiseOrValue[U]],
+        concurrency: int = 1,
+        timeout: Optional[float] = None,
+    ) -> None:
+        if not is_async_iterable(iterable):
+            raise TypeError(f'Expected an async iterable, but got: {inspect(iterable)}.')
+
+        if concurrency < 1:
+            raise ValueError(f'concurrency must be a positive number: {inspect(concurrency)}.')
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f'timeout must be a positive number: {inspect(timeout)}.')
+
+        self._iterator = iterable.__aiter__()
+        self._callback: Final[Callable[[T], PromiseOrValue[U]]] = callback
+        self._concurrency = concurrency
+        self._timeout = timeout
+        # Created lazily, so that they belong to the event loop which iterates.
+        self._slots = None
+        self._results = None
+        self._head = None
+        self._pump_task = None
+        self._is_closed = False
+
+    def __aiter__(self) -> 'MapAsyncIterator[T, U]':
+        return self
+
+    async def __anext__(self) -> U:
+        if self._is_closed:
+            raise StopAsyncIteration
+
+        if self._slots is None or self._results is None:
+            self._slots = asyncio.Semaphore(self._concurrency)
+            self._results = asyncio.Queue()
+            self._pump_task = asyncio.ensure_future(self._pump(self._slots, self._results))
+
+        if self._head is None:
+            result = await self._results.get()
+            if isinstance(result, _EndType):
+                self._is_closed = True
+                # Leave the end in the queue for any other task waiting for a value.
+                self._results.put_nowait(_end)
+                raise StopAsyncIteration
+            self._head = result
+
+        head: Final = self._head
+        try:
+            # Shielded, so that a consumer which stops waiting, e.g. to send a keepalive,
+            # gets the same value on its next call instead of losing it.
+            value: Final = await asyncio.shield(head)
+        except asyncio.CancelledError:
+            if not head.done():
+                raise
+            self._pass_head(head)
+            if self._is_closed:
+                raise StopAsyncIteration from None
+            raise
+        except Exception as error:
+            self._pass_head(head)
+            try:
+                await self.aclose()
+            except Exception:  # pylint: disable=broad-except
+                # The error which ended the iteration is raised, the one of closing is its context.
+                raise error  # pylint: disable=raise-missing-from
+            raise
+
+        self._pass_head(head)
+        return value
+
+    async def aclose(self) -> None:
+        """Stops mapping, cancels the pending values and closes the source.
+
+        Tasks waiting for the next value get `StopAsyncIteration`. An error raised
+        by the source while closing is raised from here.
+        """
+
+        self._is_closed = True
+
+        pump_task: Final = self._pump_task
+        if pump_task is not None:
+            self._pump_task = None
+            pump_task.cancel()
+            await asyncio.wait([pump_task])
+
+        head: Final = self._head
+        if head is not None:
+            self._head = None
+            _discard(head)
+
+        results: Final = self._results
+        while results is not None and not results.empty():
+            result = results.get_nowait()
+            if not isinstance(result, _EndType):
+                _discard(result)
+        if results is not None:
+            results.put_nowait(_end)
+
+        aclose = getattr(self._iterator, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+    def _pass_head(self, head: 'asyncio.Future[U]') -> None:
+        # aclose() may have discarded the head already.
+        if self._head is head:
+            self._head = None
+        if self._slots is not None:
+            self._slots.release()
+
+    async def _pump(
+        self,
+        slots: asyncio.Semaphore,
+        results: 'asyncio.Queue[_Result[U]]',
+    ) -> None:
+        loop: Final = asyncio.get_running_loop()
+
+        while True:
+            await slots.acquire()
+            try:
+                value = await self._iterator.__anext__()
+            except StopAsyncIteration:
+                results.put_nowait(_end)
+                return
+            except Exception as error:  # pylint: disable=broad-except
+                failed: asyncio.Future[U] = loop.create_future()
+                failed.set_exception(error)
+                results.put_nowait(failed)
+                return
+
+            results.put_nowait(self._map_value(loop, value))
+
+    def _map_value(self, loop: asyncio.AbstractEventLoop, value: T) -> 'asyncio.Future[U]':
+        try:
+            mapped = self._callback(value)
+        except Exception as error:  # pylint: disable=broad-except
+            failed: asyncio.Future[U] = loop.create_future()
+            failed.set_exception(error)
+            return failed
+
+        if is_promise(mapped):
+            promise: Final = cast(Promise[U], mapped)
+            if self._timeout is not None:
+                return asyncio.ensure_future(asyncio.wait_for(promise, self._timeout))
+            return asyncio.ensure_future(promise)
+
+        resolved: asyncio.Future[U] = loop.create_future()
+        resolved.set_result(cast(U, mapped))
+        return resolved
+
+
+def _discard(result: 'asyncio.Future[T]') -> None:
+    if not result.done():
+        result.cancel()
+    elif not result.cancelled():
+        result.exception()  # mark as retrieved
+
+
+def map_async_iterator(
+    iterable: AsyncIterable[T],
+    callback: Callable[[T], PromiseOrValue[U]],
+    concurrency: int = 1,
+    timeout: Optional[float] = None,
+) -> MapAsyncIterator[T, U]:
+    """
+    Given an AsyncIterable and a callback function, return an AsyncIterator
+    which produces values mapped via calling the callback function.
+    """
+
+    return MapAsyncIterator(iterable, callback, concurrency, timeout)
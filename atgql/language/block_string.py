@@ -17,7 +17,7 @@ def dedent_block_string_value(raw_string: str) -> str:
     common_indent: Final[int] = get_block_string_indentation(raw_string)
 
     if common_indent != 0:
-        for i, _ in enumerate(lines):
+        for i in range(1, len(lines)):
             lines[i] = lines[i][common_indent:]
 
     # Remove leading and trailing blank lines.
@@ -50,14 +50,14 @@ def get_block_string_indentation(value: str) -> int:
     i = 0
     while i < len(value):
         if value[i] == '\r':
-            if value[i + 1] == chr(10):
+            if value.startswith('\n', i + 1):
                 i += 1  # skip \r\n as one symbol
 
             is_first_line = False
             is_empty_line = True
             indent = 0
 
-        elif value[i] == '\r':
+        elif value[i] == '\n':
             is_first_line = False
             is_empty_line = True
             indent = 0
@@ -81,9 +81,9 @@ def get_block_string_indentation(value: str) -> int:
 
 def print_block_string(value: str, prefer_multiple_lines: bool = False) -> str:
     is_single_line: Final[bool] = '\n' not in value
-    has_leading_space: Final[bool] = value[0] == ' ' or value[0] == '\t'
-    has_trailing_quote: Final[bool] = value[-1] == '"'
-    has_trailing_slash: Final[bool] = value[-1] == '\\'
+    has_leading_space: Final[bool] = value[:1] in (' ', '\t')
+    has_trailing_quote: Final[bool] = value[-1:] == '"'
+    has_trailing_slash: Final[bool] = value[-1:] == '\\'
     print_as_multiple_lines: Final[bool] = (
         not is_single_line or has_trailing_quote or has_trailing_slash or prefer_multiple_lines
     )
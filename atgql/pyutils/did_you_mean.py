@@ -27,7 +27,8 @@ def did_you_mean(
     if sub_message is not None:
         message += f'{sub_message} '
 
-    suggestions: Final[list[str]] = list(map(lambda x: f'"{x}"', suggestions_arg))
+    # Only the suggestions that will be printed need to be quoted.
+    suggestions: Final[list[str]] = [f'"{x}"' for x in suggestions_arg[:MAX_SUGGESTIONS]]
     len_suggestions = len(suggestions)
     if len_suggestions == 0:
         return ''
@@ -36,6 +37,5 @@ def did_you_mean(
     elif len_suggestions == 2:
         return f'{message}{suggestions[0]} or {suggestions[1]}?'
 
-    selected = suggestions[:MAX_SUGGESTIONS]
-    last_item: Final[str] = selected.pop()
-    return f'{message}{", ".join(selected)}, or {last_item}?'
+    last_item: Final[str] = suggestions.pop()
+    return f'{message}{", ".join(suggestions)}, or {last_item}?'
@@ -1,7 +1,7 @@
 __all__ = ['is_promise']
 
 import inspect
-from typing import TypeVar
+from typing import Any, Final, TypeVar
 
 from typing_extensions import TypeGuard
 
@@ -10,6 +10,12 @@ from atgql.shims import Promise
 
 T = TypeVar('T')
 
+# Exact types of the values resolvers return most of the time, none of them is awaitable.
+# Checking them first keeps the sync path away from the slower ABC checks below.
+_non_promise_types: Final[frozenset[type[Any]]] = frozenset(
+    {type(None), bool, int, float, str, bytes, list, tuple, dict}
+)
+
 
 def is_promise(value: PromiseOrValue[T]) -> TypeGuard[Promise[T]]:
     """Return True if the object can be used in await expression.
@@ -17,4 +23,7 @@ def is_promise(value: PromiseOrValue[T]) -> TypeGuard[Promise[T]]:
     Generator-based coroutines are awaitables,
     even though they do not have an __await__() method.
     """
+    if type(value) in _non_promise_types:
+        return False
+
     return inspect.isawaitable(value)
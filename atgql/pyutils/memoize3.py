@@ -1,7 +1,7 @@
 __all__ = ['memoize3']
 
 from collections.abc import Callable
-from typing import TypeVar, Union
+from typing import Optional, TypeVar, Union
 from weakref import WeakKeyDictionary
 
 A1 = TypeVar('A1')
@@ -18,18 +18,22 @@ _undefined = _UndefinedType()
 
 
 def memoize3(fn: Callable[[A1, A2, A3], R]) -> Callable[[A1, A2, A3], R]:
-    """Memoizes the provided three-argument function."""
+    """Memoizes the provided three-argument function.
 
-    cache0: list[WeakKeyDictionary] = []
+    All arguments are held weakly, so they must be hashable and weak referenceable.
+    """
+
+    cache0: Optional[WeakKeyDictionary] = None
 
     def memoized(a1: A1, a2: A2, a3: A3) -> R:
-        if len(cache0) == 0:
-            cache0[0] = WeakKeyDictionary()
+        nonlocal cache0
+        if cache0 is None:
+            cache0 = WeakKeyDictionary()
 
-        cache1 = cache0[0].get(a1)
+        cache1 = cache0.get(a1)
         if cache1 is None:
             cache1 = WeakKeyDictionary()
-            cache0[0][a1] = cache1
+            cache0[a1] = cache1
 
         cache2 = cache1.get(a2)
         if cache2 is None:
@@ -8,6 +8,9 @@ from atgql.pyutils.maybe import Maybe
 
 @dataclass
 class Path:
+    # A Path is allocated for every field and list item during execution.
+    __slots__ = ('prev', 'key', 'typename')
+
     prev: Optional['Path']
     key: Union[str, int]
     typename: Optional[str]
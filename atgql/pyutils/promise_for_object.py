@@ -1,7 +1,7 @@
 __all__ = ['promise_for_object']
 
 import asyncio
-from typing import TypeVar
+from typing import Final, TypeVar
 
 from atgql.pyutils.obj_map import ObjMap
 from atgql.shims import Promise
@@ -10,7 +10,26 @@ T = TypeVar('T')
 
 
 def promise_for_object(obj: ObjMap[Promise[T]]) -> Promise[ObjMap[T]]:
+    """
+    This function transforms a dict of awaitables `ObjMap[Promise[T]]` into
+    an awaitable of a dict `Promise[ObjMap[T]]`.
+
+    Once any of the awaitables fails, or the returned awaitable is cancelled,
+    the awaitables which are still pending are cancelled, so that no work is
+    spent on a result which will never be used. Futures are the exception: they
+    may be awaited by others as well, so they are left running.
+    """
+
     async def transformer() -> ObjMap[T]:
-        return dict(zip(obj.keys(), await asyncio.gather(*obj.values())))
+        futures: Final = [
+            asyncio.shield(value) if asyncio.isfuture(value) else asyncio.ensure_future(value)
+            for value in obj.values()
+        ]
+        try:
+            return dict(zip(obj.keys(), await asyncio.gather(*futures)))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
     return transformer()
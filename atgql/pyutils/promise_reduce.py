@@ -34,9 +34,17 @@ def bind_current_value(
 
 def promise_reduce(
     values: Iterable[T],
-    callback_fn: Callable[[U, T], U],
+    callback_fn: Callable[[U, T], PromiseOrValue[U]],
     initial_value: PromiseOrValue[U],
 ) -> PromiseOrValue[U]:
+    """
+    Similar to Array.prototype.reduce(), however the reducing callback may return
+    a Promise, in which case reduction will continue after each promise resolves.
+
+    If the callback does not return a Promise, then this function will also not
+    return a Promise.
+    """
+
     accumulator = initial_value
     for value in values:
         if is_promise(accumulator):
@@ -79,6 +79,9 @@ class LexicalDistance:
         a_length = len(a)
         b_length = len(b)
 
+        if a_length - b_length > threshold:
+            return None
+
         rows = self._rows
         for j in range(b_length + 1):
             rows[0][j] = j
@@ -0,0 +1,29 @@
+import asyncio
+import atexit
+
+from atgql.execution.data_loader import DataLoader
+from atgql.pyutils.promise_for_object import promise_for_object
+
+name = 'Batch loads of list items with DataLoader'
+count = 100
+
+loop = asyncio.new_event_loop()
+atexit.register(loop.close)
+keys = list(range(100))
+
+
+async def batch_load(batch_keys: list[int]) -> list[int]:
+    return batch_keys
+
+
+async def resolve(loader: DataLoader[int, int], key: int) -> int:
+    return await loader.load(key)
+
+
+async def load_all() -> None:
+    loader: DataLoader[int, int] = DataLoader(batch_load)
+    await promise_for_object({str(key): resolve(loader, key) for key in keys})
+
+
+def measure() -> None:
+    loop.run_until_complete(load_all())
@@ -0,0 +1,10 @@
+from atgql.language.block_string import dedent_block_string_value
+from benchmarks.fixtures import BLOCK_STRINGS
+
+name = 'Dedent block string descriptions of a large schema'
+count = 200
+
+
+def measure() -> None:
+    for raw_string in BLOCK_STRINGS:
+        dedent_block_string_value(raw_string)
@@ -0,0 +1,36 @@
+__all__ = [
+    'BLOCK_STRINGS',
+    'COMMERCE_SCHEMA_SDL',
+    'KITCHEN_SINK_QUERY',
+    'SCHEMA_NAMES',
+    'read_fixture',
+]
+
+import re
+from pathlib import Path
+from typing import Final
+
+FIXTURES_DIR: Final[Path] = Path(__file__).parent
+
+
+def read_fixture(filename: str) -> str:
+    return (FIXTURES_DIR / filename).read_text(encoding='utf-8')
+
+
+COMMERCE_SCHEMA_SDL: Final[str] = read_fixture('commerce_schema.graphql')
+
+KITCHEN_SINK_QUERY: Final[str] = read_fixture('kitchen_sink.graphql')
+
+# Every distinct name of the schema, in order of appearance,
+# which is what suggestions are computed against.
+SCHEMA_NAMES: Final[list[str]] = list(
+    dict.fromkeys(
+        re.findall(
+            r'[_A-Za-z][_0-9A-Za-z]*',
+            re.sub(r'""".*?"""|"[^"\n]*"|#[^\n]*', '', COMMERCE_SCHEMA_SDL, flags=re.DOTALL),
+        )
+    )
+)
+
+# The raw values of the block string descriptions of the schema.
+BLOCK_STRINGS: Final[list[str]] = re.findall(r'"""(.*?)"""', COMMERCE_SCHEMA_SDL, re.DOTALL)
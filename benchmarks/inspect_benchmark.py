@@ -0,0 +1,24 @@
+from atgql.pyutils.inspect_ import inspect
+from benchmarks.fixtures import KITCHEN_SINK_QUERY, SCHEMA_NAMES
+
+name = 'Inspect values for error messages'
+count = 200
+
+values = [
+    None,
+    True,
+    42,
+    3.14,
+    KITCHEN_SINK_QUERY,
+    SCHEMA_NAMES,
+    {'input': {'lines': [{'merchandiseId': 'gid://Variant/1', 'quantity': 2}], 'note': None}},
+    (1, 'two', [3.0]),
+    frozenset(SCHEMA_NAMES[:3]),
+    inspect,
+    ValueError('Expected value of type "Int!", found "abc".'),
+]
+
+
+def measure() -> None:
+    for value in values:
+        inspect(value)
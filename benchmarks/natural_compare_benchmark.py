@@ -0,0 +1,13 @@
+from functools import cmp_to_key
+
+from atgql.pyutils.natural_compare import natural_compare
+from benchmarks.fixtures import SCHEMA_NAMES
+
+name = 'Sort names of a large schema in natural order'
+count = 20
+
+names = [f'{name}{i}' for i in range(10) for name in SCHEMA_NAMES]
+
+
+def measure() -> None:
+    sorted(names, key=cmp_to_key(natural_compare))
@@ -0,0 +1,22 @@
+import asyncio
+import atexit
+
+from atgql.pyutils.promise_for_object import promise_for_object
+from benchmarks.fixtures import SCHEMA_NAMES
+
+name = 'Resolve sibling fields with promise_for_object'
+count = 100
+
+loop = asyncio.new_event_loop()
+atexit.register(loop.close)
+field_names = SCHEMA_NAMES[:100]
+
+
+async def resolve(field_name: str) -> str:
+    return field_name
+
+
+def measure() -> None:
+    loop.run_until_complete(
+        promise_for_object({field_name: resolve(field_name) for field_name in field_names})
+    )
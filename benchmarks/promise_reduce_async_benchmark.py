@@ -0,0 +1,22 @@
+import asyncio
+import atexit
+from typing import cast
+
+from atgql.pyutils.promise_reduce import promise_reduce
+from atgql.shims import Promise
+
+name = 'Reduce awaitables with promise_reduce'
+count = 100
+
+loop = asyncio.new_event_loop()
+atexit.register(loop.close)
+values = list(range(100))
+
+
+async def add(accumulator: int, value: int) -> int:
+    return accumulator + value
+
+
+def measure() -> None:
+    # The reduction is awaitable, because so is every result of `add`.
+    loop.run_until_complete(cast(Promise[int], promise_reduce(values, add, 0)))
@@ -0,0 +1,14 @@
+from atgql.pyutils.promise_reduce import promise_reduce
+
+name = 'Reduce plain values with promise_reduce'
+count = 1000
+
+values = list(range(100))
+
+
+def add(accumulator: int, value: int) -> int:
+    return accumulator + value
+
+
+def measure() -> None:
+    promise_reduce(values, add, 0)
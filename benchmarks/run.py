@@ -0,0 +1,249 @@
+"""Runs the benchmarks and compares the results against a stored baseline.
+
+Every module named `*_benchmark` in this package is a benchmark, which defines:
+
+- `name`: a human readable name of the benchmark,
+- `count`: how many times `measure` is called per sample,
+- `measure()`: the code being benchmarked.
+
+Usage:
+
+    python -m benchmarks.run [NAME ...] [--memory] [--output FILE] [--baseline FILE]
+                             [--threshold RATIO]
+
+Results are written as JSON to `--output`, a result file from an earlier run
+can be passed as `--baseline` to report changes, in which case the exit status
+is non-zero if any benchmark is slower than the baseline by more than `--threshold`.
+
+With `--memory`, the allocations of one call of `measure` are also traced with
+`tracemalloc`, in a separate pass so that tracing does not distort the timings,
+and an increase of them by more than `--threshold` is reported as a regression too.
+"""
+
+__all__ = [
+    'BenchmarkResult',
+    'benchmark_id',
+    'compare_results',
+    'load_benchmarks',
+    'main',
+    'run_benchmark',
+    'trace_memory',
+]
+
+import argparse
+import gc
+import importlib
+import json
+import pkgutil
+import platform
+import statistics
+import sys
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Final, Optional, cast
+
+BENCHMARK_SUFFIX: Final[str] = '_benchmark'
+DEFAULT_SAMPLES: Final[int] = 10
+DEFAULT_THRESHOLD: Final[float] = 0.1
+
+
+@dataclass
+class BenchmarkResult:
+    # the module name without the `_benchmark` suffix, which identifies the benchmark in reports
+    id: str
+    name: str
+    # operations per second, averaged over all samples
+    ops: float
+    # relative margin of error of `ops`, in percent
+    rme: float
+    samples: int
+    count: int
+    # the peak of memory allocated during one call of `measure`, in bytes, traced with --memory
+    memory_peak: Optional[int] = None
+    # the memory still allocated after one call of `measure`, in bytes, traced with --memory
+    memory_retained: Optional[int] = None
+
+
+def load_benchmarks(names: Sequence[str] = ()) -> list[ModuleType]:
+    """Imports the benchmark modules of this package, or only those whose id is in `names`."""
+
+    package_dir: Final[str] = str(Path(__file__).parent)
+    modules: Final[list[ModuleType]] = []
+
+    for module_info in sorted(pkgutil.iter_modules([package_dir]), key=lambda info: info.name):
+        if not module_info.name.endswith(BENCHMARK_SUFFIX):
+            continue
+
+        if names and module_info.name[: -len(BENCHMARK_SUFFIX)] not in names:
+            continue
+
+        modules.append(importlib.import_module(f'{__package__}.{module_info.name}'))
+
+    return modules
+
+
+def benchmark_id(module: ModuleType) -> str:
+    return module.__name__.rpartition('.')[2][: -len(BENCHMARK_SUFFIX)]
+
+
+def run_benchmark(module: ModuleType, samples: int = DEFAULT_SAMPLES) -> BenchmarkResult:
+    count: Final = cast(int, getattr(module, 'count'))
+    measure: Final = cast(Callable[[], object], getattr(module, 'measure'))
+
+    # Warm up caches and lazily created objects, the first sample is usually an outlier.
+    for _ in range(count):
+        measure()
+
+    timings: Final[list[float]] = []
+    gc_was_enabled: Final[bool] = gc.isenabled()
+    try:
+        for _ in range(samples):
+            gc.collect()
+            gc.disable()
+
+            start = perf_counter_ns()
+            for _ in range(count):
+                measure()
+            elapsed = perf_counter_ns() - start
+
+            if gc_was_enabled:
+                gc.enable()
+            timings.append(count * 1e9 / max(elapsed, 1))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    ops: Final[float] = statistics.mean(timings)
+    rme: Final[float] = (
+        statistics.stdev(timings) / (len(timings) ** 0.5) / ops * 100 if len(timings) > 1 else 0.0
+    )
+    return BenchmarkResult(
+        id=benchmark_id(module),
+        name=cast(str, getattr(module, 'name')),
+        ops=ops,
+        rme=rme,
+        samples=samples,
+        count=count,
+    )
+
+
+def trace_memory(module: ModuleType) -> tuple[int, int]:
+    """Returns the peak and the retained size of the allocations of one call of `measure`."""
+
+    measure: Final = cast(Callable[[], object], getattr(module, 'measure'))
+    # Allocations of the first call are mostly lazily created objects, not what is measured.
+    measure()
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        measure()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, retained
+
+
+def compare_results(
+    results: Sequence[BenchmarkResult], baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """Prints the change of every result against `baseline`, returns the ids of the regressions."""
+
+    baseline_results: Final[dict] = baseline.get('benchmarks', {})
+    regressions: Final[list[str]] = []
+
+    for result in results:
+        base = baseline_results.get(result.id)
+        if base is None:
+            print(f'{result.name}: no baseline')
+            continue
+
+        change = result.ops / base['ops'] - 1
+        is_regression = change < -threshold
+        if is_regression:
+            regressions.append(result.id)
+
+        marker = ' <- regression' if is_regression else ''
+        print(
+            f'{result.name}: {base["ops"]:,.0f} -> {result.ops:,.0f} ops/sec '
+            f'({change:+.1%}){marker}'
+        )
+
+        for field in ('memory_peak', 'memory_retained'):
+            current_size = getattr(result, field)
+            base_size = base.get(field)
+            if current_size is None or base_size is None:
+                continue
+
+            # Sizes below 1 KiB are dominated by interpreter free lists, not by the benchmark.
+            size_change = (current_size - base_size) / max(base_size, 1024)
+            is_regression = size_change > threshold
+            if is_regression and result.id not in regressions:
+                regressions.append(result.id)
+
+            marker = ' <- regression' if is_regression else ''
+            print(
+                f'  {field}: {base_size:,} -> {current_size:,} bytes '
+                f'({size_change:+.1%}){marker}'
+            )
+
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: Final = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__)
+    parser.add_argument('names', nargs='*', help='ids of the benchmarks to run, e.g. inspect')
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument('--memory', action='store_true', help='also trace memory allocations')
+    parser.add_argument('--output', type=Path, help='write the results as JSON to this file')
+    parser.add_argument('--baseline', type=Path, help='compare with the results in this file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args: Final = parser.parse_args(argv)
+
+    modules: Final = load_benchmarks(args.names)
+    unknown_names: Final = sorted(set(args.names) - {benchmark_id(module) for module in modules})
+    if unknown_names:
+        parser.error(f'unknown benchmark: {", ".join(unknown_names)}')
+
+    results: Final[list[BenchmarkResult]] = []
+    for module in modules:
+        result = run_benchmark(module, args.samples)
+        results.append(result)
+        print(
+            f'{result.name}: {result.ops:,.0f} ops/sec '
+            f'\xb1{result.rme:.2f}% ({result.samples} runs)'
+        )
+
+        if args.memory:
+            result.memory_peak, result.memory_retained = trace_memory(module)
+            print(
+                f'  {result.memory_peak:,} bytes peak, '
+                f'{result.memory_retained:,} bytes retained per call'
+            )
+
+    if args.output is not None:
+        report = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'benchmarks': {result.id: asdict(result) for result in results},
+        }
+        args.output.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+
+    if args.baseline is not None:
+        print()
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        if compare_results(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
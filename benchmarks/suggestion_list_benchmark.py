@@ -0,0 +1,10 @@
+from atgql.pyutils.suggestion_list import suggestion_list
+from benchmarks.fixtures import SCHEMA_NAMES
+
+name = 'Suggest names of a large schema'
+count = 20
+
+
+def measure() -> None:
+    suggestion_list('prodcutVarient', SCHEMA_NAMES)
+    suggestion_list('id', SCHEMA_NAMES)
@@ -0,0 +1,93 @@
+# Notice: These tests are not transformed from graphql-js
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import TypeVar
+
+import pytest
+
+from atgql.execution.blocking_resolver import blocking_resolver
+from atgql.pyutils.is_promise import is_promise
+from atgql.pyutils.promise_for_object import promise_for_object
+from atgql.pyutils.promise_or_value import PromiseOrValue
+from atgql.shims import Promise
+
+T = TypeVar('T')
+
+
+def expect_promise(value: PromiseOrValue[T]) -> Promise[T]:
+    assert is_promise(value)
+    return value
+
+
+def test_calls_resolver_directly_without_running_event_loop() -> None:
+    @blocking_resolver
+    def resolve(obj: dict[str, str], unused_info: None) -> str:
+        return obj['name']
+
+    assert resolve({'name': 'Luke'}, None) == 'Luke'
+    assert resolve.__name__ == 'resolve'  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_runs_resolver_in_thread_pool_within_event_loop() -> None:
+    main_thread = threading.current_thread()
+
+    @blocking_resolver
+    def resolve(unused_obj: dict[str, str], unused_info: None) -> bool:
+        return threading.current_thread() is main_thread
+
+    assert await expect_promise(resolve({}, None)) is False
+
+
+@pytest.mark.asyncio
+async def test_uses_given_executor() -> None:
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='blocking') as executor:
+
+        @blocking_resolver(executor=executor)
+        def resolve() -> str:
+            return threading.current_thread().name
+
+        assert (await expect_promise(resolve())).startswith('blocking')
+
+
+@pytest.mark.asyncio
+async def test_does_not_stall_sibling_fields() -> None:
+    # Every resolver waits until all three of them run, which fails unless they overlap.
+    all_running = threading.Barrier(3, timeout=5)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+
+        @blocking_resolver(executor=executor)
+        def resolve(value: int) -> int:
+            all_running.wait()
+            return value
+
+        result = await promise_for_object(
+            {
+                'a': expect_promise(resolve(1)),
+                'b': expect_promise(resolve(2)),
+                'c': expect_promise(resolve(3)),
+            }
+        )
+        assert result == {'a': 1, 'b': 2, 'c': 3}
+
+
+@pytest.mark.asyncio
+async def test_propagates_context_variables_and_errors() -> None:
+    request_id: ContextVar[str] = ContextVar('request_id')
+
+    @blocking_resolver
+    def resolve() -> str:
+        return request_id.get()
+
+    @blocking_resolver
+    def fail() -> None:
+        raise Exception('Oops!')
+
+    request_id.set('abc')
+    assert await expect_promise(resolve()) == 'abc'
+
+    with pytest.raises(Exception, match='Oops!'):
+        await expect_promise(fail())
@@ -0,0 +1,210 @@
+# Notice: These tests are not transformed from graphql-js
+
+import asyncio
+from collections.abc import Hashable, Sequence
+from typing import Any, Optional, Union
+
+import pytest
+
+from atgql.execution.data_loader import DataLoader
+from atgql.pyutils.promise_for_object import promise_for_object
+
+
+def id_loader(
+    *,
+    cache: bool = True,
+    max_batch_size: Optional[int] = None,
+    cache_key_fn: Optional[Any] = None,
+) -> tuple[DataLoader[Any, Any], list[list[Any]]]:
+    load_calls: list[list[Any]] = []
+
+    async def batch_load_fn(keys: list[Any]) -> list[Any]:
+        load_calls.append(keys)
+        return keys
+
+    loader: DataLoader[Any, Any] = DataLoader(
+        batch_load_fn, cache=cache, max_batch_size=max_batch_size, cache_key_fn=cache_key_fn
+    )
+    return loader, load_calls
+
+
+@pytest.mark.asyncio
+async def test_builds_a_really_really_simple_data_loader() -> None:
+    loader, _ = id_loader()
+
+    future = loader.load(1)
+    assert isinstance(future, asyncio.Future)
+    assert await future == 1
+
+
+@pytest.mark.asyncio
+async def test_batches_multiple_requests() -> None:
+    loader, load_calls = id_loader()
+
+    value1, value2 = await asyncio.gather(loader.load(1), loader.load(2))
+    assert (value1, value2) == (1, 2)
+    assert load_calls == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_batches_loads_of_concurrent_resolvers() -> None:
+    loader, load_calls = id_loader()
+
+    async def resolve(key: str) -> str:
+        value: str = await loader.load(key)
+        return value
+
+    result = await promise_for_object({'a': resolve('a'), 'b': resolve('b'), 'c': resolve('c')})
+    assert result == {'a': 'a', 'b': 'b', 'c': 'c'}
+    assert load_calls == [['a', 'b', 'c']]
+
+
+@pytest.mark.asyncio
+async def test_dispatches_a_new_batch_per_event_loop_iteration() -> None:
+    loader, load_calls = id_loader()
+
+    assert await loader.load(1) == 1
+    assert await loader.load(2) == 2
+    assert load_calls == [[1], [2]]
+
+
+@pytest.mark.asyncio
+async def test_respects_max_batch_size() -> None:
+    loader, load_calls = id_loader(max_batch_size=2)
+
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+    assert load_calls == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_coalesces_and_caches_identical_requests() -> None:
+    loader, load_calls = id_loader()
+
+    future1 = loader.load(1)
+    future2 = loader.load(1)
+    assert future1 is not future2
+    assert await loader.load_many([1, 1]) == [1, 1]
+    assert await future1 == await future2 == 1
+    assert await loader.load(1) == 1
+    assert load_calls == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_does_not_cache_when_disabled() -> None:
+    loader, load_calls = id_loader(cache=False)
+
+    assert await loader.load_many([1, 1]) == [1, 1]
+    assert await loader.load(1) == 1
+    assert load_calls == [[1, 1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_uses_cache_key_fn() -> None:
+    def cache_key_fn(key: dict[str, int]) -> Hashable:
+        return key['id']
+
+    loader, load_calls = id_loader(cache_key_fn=cache_key_fn)
+
+    await loader.load_many([{'id': 1}, {'id': 1}])
+    assert load_calls == [[{'id': 1}]]
+
+
+@pytest.mark.asyncio
+async def test_clears_and_primes_the_cache() -> None:
+    loader, load_calls = id_loader()
+
+    loader.prime('a', 'primed')
+    assert await loader.load('a') == 'primed'
+
+    loader.prime('a', 'ignored')
+    assert await loader.load('a') == 'primed'
+
+    loader.clear('a').prime('a', 'replaced')
+    assert await loader.load('a') == 'replaced'
+
+    loader.clear_all()
+    assert await loader.load('a') == 'a'
+    assert load_calls == [['a']]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_load_does_not_affect_other_loads_of_the_key() -> None:
+    loader, load_calls = id_loader()
+
+    cancelled = loader.load(1)
+    other = loader.load(1)
+    cancelled.cancel()
+
+    assert await other == 1
+    assert await loader.load(1) == 1
+    assert load_calls == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_does_not_cache_cancellation_of_abandoned_fields() -> None:
+    loader, load_calls = id_loader()
+
+    async def user(key: int) -> int:
+        value: int = await loader.load(key)
+        return value
+
+    async def fail() -> int:
+        raise Exception('Oops!')
+
+    with pytest.raises(Exception, match='Oops!'):
+        await promise_for_object({'a': user(1), 'b': fail()})
+
+    assert await loader.load(1) == 1
+    assert load_calls == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_rejects_only_the_keys_with_errors_and_does_not_cache_them() -> None:
+    load_calls: list[list[int]] = []
+
+    async def batch_load_fn(keys: list[int]) -> Sequence[Union[int, Exception]]:
+        load_calls.append(keys)
+        return [Exception(f'Odd: {key}') if key % 2 else key for key in keys]
+
+    loader: DataLoader[int, int] = DataLoader(batch_load_fn)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert str(results[0]) == 'Odd: 1'
+    assert results[1] == 2
+
+    with pytest.raises(Exception, match='Odd: 1'):
+        await loader.load(1)
+    assert load_calls == [[1, 2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_rejects_all_keys_when_batch_function_fails() -> None:
+    async def batch_load_fn(keys: list[int]) -> list[int]:
+        raise Exception('Oops!')
+
+    loader: DataLoader[int, int] = DataLoader(batch_load_fn)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert [str(result) for result in results] == ['Oops!', 'Oops!']
+
+
+@pytest.mark.asyncio
+async def test_rejects_values_of_wrong_length() -> None:
+    async def batch_load_fn(keys: list[int]) -> list[int]:
+        return keys[1:]
+
+    loader: DataLoader[int, int] = DataLoader(batch_load_fn)
+
+    with pytest.raises(TypeError, match='same length as the keys'):
+        await loader.load_many([1, 2])
+
+
+def test_requires_a_function() -> None:
+    with pytest.raises(TypeError, match='must be constructed with a function'):
+        DataLoader(None)  # type: ignore[arg-type]
+
+    async def batch_load_fn(keys: list[int]) -> list[int]:
+        return keys
+
+    with pytest.raises(ValueError, match='max_batch_size must be a positive number'):
+        DataLoader(batch_load_fn, max_batch_size=0)
@@ -0,0 +1,294 @@
+# Notice: These tests are not transformed from graphql-js
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TypeVar
+
+import pytest
+
+from atgql.execution.map_async_iterator import MapAsyncIterator, map_async_iterator
+
+T = TypeVar('T')
+
+
+async def collect(iterator: AsyncIterator[T]) -> list[T]:
+    return [value async for value in iterator]
+
+
+async def count_to_three() -> AsyncIterator[int]:
+    yield 1
+    yield 2
+    yield 3
+
+
+def double(x: int) -> int:
+    return x + x
+
+
+@pytest.mark.asyncio
+async def test_maps_over_async_generator() -> None:
+    doubles: MapAsyncIterator[int, int] = map_async_iterator(count_to_three(), double)
+    assert await collect(doubles) == [2, 4, 6]
+
+    with pytest.raises(StopAsyncIteration):
+        await doubles.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_maps_over_async_iterable() -> None:
+    class Iterable:
+        def __init__(self) -> None:
+            self.items = [1, 2, 3]
+
+        def __aiter__(self) -> 'Iterable':
+            return self
+
+        async def __anext__(self) -> int:
+            if not self.items:
+                raise StopAsyncIteration
+            return self.items.pop(0)
+
+    doubles: MapAsyncIterator[int, int] = map_async_iterator(Iterable(), double)
+    assert await collect(doubles) == [2, 4, 6]
+
+
+@pytest.mark.asyncio
+async def test_compatible_with_async_callbacks() -> None:
+    async def async_double(x: int) -> int:
+        return x + x
+
+    doubles: MapAsyncIterator[int, int] = map_async_iterator(count_to_three(), async_double)
+    assert await collect(doubles) == [2, 4, 6]
+
+
+def test_rejects_non_async_iterables() -> None:
+    with pytest.raises(TypeError, match=r'Expected an async iterable, but got: \[1, 2\]\.'):
+        map_async_iterator([1, 2], double)  # type: ignore[arg-type]
+
+
+def test_rejects_invalid_concurrency_and_timeout() -> None:
+    with pytest.raises(ValueError, match='concurrency must be a positive number: 0.'):
+        map_async_iterator(count_to_three(), double, concurrency=0)
+
+    with pytest.raises(ValueError, match='timeout must be a positive number: 0.'):
+        map_async_iterator(count_to_three(), double, timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_maps_concurrently_preserving_source_order() -> None:
+    running = 0
+    max_running = 0
+
+    async def source() -> AsyncIterator[int]:
+        for i in range(6):
+            yield i
+
+    async def slow_when_even(x: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.02 if x % 2 == 0 else 0)
+        running -= 1
+        return x
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(source(), slow_when_even, concurrency=3)
+    assert await collect(mapped) == [0, 1, 2, 3, 4, 5]
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_stops_pulling_the_source_when_the_consumer_is_slow() -> None:
+    pulled: list[int] = []
+
+    async def source() -> AsyncIterator[int]:
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(source(), double, concurrency=2)
+    assert await mapped.__anext__() == 0
+
+    await asyncio.sleep(0.01)
+    assert pulled == [0, 1, 2]
+
+    await mapped.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fails_values_whose_mapping_times_out() -> None:
+    pulled: list[int] = []
+
+    async def source() -> AsyncIterator[int]:
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    async def hang_on_one(x: int) -> int:
+        if x == 1:
+            await asyncio.Event().wait()
+        return x
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(
+        source(), hang_on_one, concurrency=2, timeout=0.01
+    )
+    assert await mapped.__anext__() == 0
+
+    with pytest.raises(asyncio.TimeoutError):
+        await mapped.__anext__()
+
+    with pytest.raises(StopAsyncIteration):
+        await mapped.__anext__()
+    assert pulled == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_allows_closing_early_and_closes_the_source() -> None:
+    did_close = False
+
+    async def source() -> AsyncIterator[int]:
+        nonlocal did_close
+        try:
+            for i in range(100):
+                yield i
+        finally:
+            did_close = True
+
+    async def slow(x: int) -> int:
+        await asyncio.sleep(0.01 * x)
+        return x
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(source(), slow, concurrency=4)
+    assert await mapped.__anext__() == 0
+    assert await mapped.__anext__() == 1
+
+    await mapped.aclose()
+    assert did_close is True
+
+    with pytest.raises(StopAsyncIteration):
+        await mapped.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_closing_ends_pending_iterations() -> None:
+    resume = asyncio.Event()
+
+    async def source() -> AsyncIterator[int]:
+        await resume.wait()
+        yield 1
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(source(), double)
+    waiters = [asyncio.ensure_future(mapped.__anext__()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    await mapped.aclose()
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+    assert [type(result) for result in results] == [StopAsyncIteration, StopAsyncIteration]
+
+
+@pytest.mark.asyncio
+async def test_raises_errors_of_closing_the_source() -> None:
+    class Iterable:
+        def __aiter__(self) -> 'Iterable':
+            return self
+
+        async def __anext__(self) -> int:
+            return 1
+
+        async def aclose(self) -> None:
+            raise Exception('Cannot close')
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(Iterable(), double)
+    assert await mapped.__anext__() == 2
+
+    with pytest.raises(Exception, match='Cannot close'):
+        await mapped.aclose()
+
+
+@pytest.mark.asyncio
+async def test_keeps_the_next_value_when_the_consumer_stops_waiting() -> None:
+    async def slow(x: int) -> int:
+        await asyncio.sleep(0.03)
+        return x
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(count_to_three(), slow)
+    received: list[object] = []
+    while True:
+        try:
+            received.append(await asyncio.wait_for(mapped.__anext__(), 0.02))
+        except asyncio.TimeoutError:
+            received.append('keepalive')
+        except StopAsyncIteration:
+            break
+
+    assert [value for value in received if value != 'keepalive'] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_raises_the_error_of_mapping_when_closing_the_source_fails_too() -> None:
+    class Iterable:
+        def __aiter__(self) -> 'Iterable':
+            return self
+
+        async def __anext__(self) -> int:
+            return 1
+
+        async def aclose(self) -> None:
+            raise Exception('Cannot close')
+
+    def fail(unused_x: int) -> int:
+        raise Exception('Cannot map')
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(Iterable(), fail)
+
+    with pytest.raises(Exception, match='Cannot map') as exc_info:
+        await mapped.__anext__()
+    assert str(exc_info.value.__context__) == 'Cannot close'
+
+
+@pytest.mark.asyncio
+async def test_yields_values_before_an_error_of_the_source() -> None:
+    async def source() -> AsyncIterator[str]:
+        yield 'Hello'
+        raise Exception('Goodbye')
+
+    def append_world(x: str) -> str:
+        return x + ' World'
+
+    mapped: MapAsyncIterator[str, str] = map_async_iterator(source(), append_world, concurrency=2)
+    assert await mapped.__anext__() == 'Hello World'
+
+    with pytest.raises(Exception, match='Goodbye'):
+        await mapped.__anext__()
+
+    with pytest.raises(StopAsyncIteration):
+        await mapped.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_closes_source_when_callback_raises() -> None:
+    did_close = False
+
+    async def source() -> AsyncIterator[int]:
+        nonlocal did_close
+        try:
+            yield 1
+            yield 2
+            yield 3
+        finally:
+            did_close = True
+
+    def callback(x: int) -> int:
+        if x == 2:
+            raise Exception('Cannot map 2')
+        return x
+
+    mapped: MapAsyncIterator[int, int] = map_async_iterator(source(), callback)
+    assert await mapped.__anext__() == 1
+
+    with pytest.raises(Exception, match='Cannot map 2'):
+        await mapped.__anext__()
+    assert did_close is True
+
+    with pytest.raises(StopAsyncIteration):
+        await mapped.__anext__()
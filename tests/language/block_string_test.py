@@ -0,0 +1,133 @@
+from atgql.language.block_string import (
+    dedent_block_string_value,
+    get_block_string_indentation,
+    print_block_string,
+)
+
+
+def join_lines(*args: str) -> str:
+    return '\n'.join(args)
+
+
+def test_dedent_removes_uniform_indentation_from_a_string():
+    raw_value = join_lines('', '    Hello,', '      World!', '', '    Yours,', '      GraphQL.')
+    assert dedent_block_string_value(raw_value) == join_lines(
+        'Hello,', '  World!', '', 'Yours,', '  GraphQL.'
+    )
+
+
+def test_dedent_removes_empty_leading_and_trailing_lines():
+    raw_value = join_lines(
+        '', '', '    Hello,', '      World!', '', '    Yours,', '      GraphQL.', '', ''
+    )
+    assert dedent_block_string_value(raw_value) == join_lines(
+        'Hello,', '  World!', '', 'Yours,', '  GraphQL.'
+    )
+
+
+def test_dedent_removes_blank_leading_and_trailing_lines():
+    raw_value = join_lines(
+        '  ',
+        '        ',
+        '    Hello,',
+        '      World!',
+        '',
+        '    Yours,',
+        '      GraphQL.',
+        '        ',
+        '  ',
+    )
+    assert dedent_block_string_value(raw_value) == join_lines(
+        'Hello,', '  World!', '', 'Yours,', '  GraphQL.'
+    )
+
+
+def test_dedent_retains_indentation_from_first_line():
+    raw_value = join_lines('    Hello,', '      World!', '', '    Yours,', '      GraphQL.')
+    assert dedent_block_string_value(raw_value) == join_lines(
+        '    Hello,', '  World!', '', 'Yours,', '  GraphQL.'
+    )
+
+
+def test_dedent_does_not_alter_trailing_spaces():
+    raw_value = join_lines(
+        '               ',
+        '    Hello,     ',
+        '      World!   ',
+        '               ',
+        '    Yours,     ',
+        '      GraphQL. ',
+        '               ',
+    )
+    assert dedent_block_string_value(raw_value) == join_lines(
+        'Hello,     ', '  World!   ', '           ', 'Yours,     ', '  GraphQL. '
+    )
+
+
+def test_get_block_string_indentation_returns_zero_for_an_empty_string():
+    assert get_block_string_indentation('') == 0
+
+
+def test_get_block_string_indentation_do_not_take_first_line_into_account():
+    assert get_block_string_indentation('  a') == 0
+    assert get_block_string_indentation(' a\n  b') == 2
+
+
+def test_get_block_string_indentation_returns_minimal_indentation():
+    assert get_block_string_indentation('\n a\n  b') == 1
+    assert get_block_string_indentation('\n  a\n b') == 1
+    assert get_block_string_indentation('\n  a\n b\nc') == 0
+
+
+def test_get_block_string_indentation_count_both_tab_and_space_as_single_character():
+    assert get_block_string_indentation('\n\ta\n          b') == 1
+    assert get_block_string_indentation('\n\t a\n          b') == 2
+    assert get_block_string_indentation('\n \t a\n          b') == 3
+
+
+def test_get_block_string_indentation_do_not_take_empty_lines_into_account():
+    assert get_block_string_indentation('a\n ') == 0
+    assert get_block_string_indentation('a\n\t') == 0
+    assert get_block_string_indentation('a\n\n b') == 1
+    assert get_block_string_indentation('a\n\n  b') == 2
+
+
+def test_get_block_string_indentation_treat_cr_lf_cr_and_lf_as_line_separators():
+    assert get_block_string_indentation('a\r\n b') == 1
+    assert get_block_string_indentation('a\r b') == 1
+    assert get_block_string_indentation('a\n b') == 1
+    assert get_block_string_indentation('a\r') == 0
+
+
+def test_print_block_string_by_default_print_block_strings_as_single_line():
+    string = 'one liner'
+    assert print_block_string(string) == '"""one liner"""'
+    assert print_block_string(string, True) == '"""\none liner\n"""'
+
+
+def test_print_block_string_correctly_prints_empty_string():
+    assert print_block_string('') == '""""""'
+    assert print_block_string('', True) == '"""\n\n"""'
+
+
+def test_print_block_string_correctly_prints_single_line_with_leading_space():
+    string = '    space-led string'
+    assert print_block_string(string) == '"""    space-led string"""'
+    assert print_block_string(string, True) == '"""    space-led string\n"""'
+
+
+def test_print_block_string_correctly_prints_single_line_with_leading_space_and_quotation():
+    string = '    space-led value "quoted string"'
+    assert print_block_string(string) == '"""    space-led value "quoted string"\n"""'
+
+
+def test_print_block_string_correctly_prints_single_line_with_trailing_backslash():
+    string = 'backslash \\'
+    assert print_block_string(string) == '"""\nbackslash \\\n"""'
+
+
+def test_print_block_string_correctly_prints_string_with_a_first_line_indentation():
+    string = join_lines('    first  ', '  line     ', 'indentation', '     string')
+    assert print_block_string(string) == join_lines(
+        '"""', '    first  ', '  line     ', 'indentation', '     string', '"""'
+    )
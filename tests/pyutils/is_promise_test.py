@@ -0,0 +1,70 @@
+# Notice: These tests are not transformed from graphql-js
+
+import asyncio
+from collections.abc import Callable, Generator
+from types import coroutine
+from typing import Any, cast
+
+import pytest
+
+from atgql.pyutils.is_promise import is_promise
+from atgql.pyutils.promise_or_value import PromiseOrValue
+
+
+@pytest.mark.asyncio
+async def test_should_return_true_for_awaitables() -> None:
+    async def async_func() -> None:
+        pass
+
+    coro: PromiseOrValue[None] = async_func()
+    assert is_promise(coro) is True
+    assert is_promise(coro)
+    await coro
+
+    def generator_func() -> Generator[None, None, None]:
+        yield
+
+    generator_based_coroutine = cast(Callable[[], PromiseOrValue[None]], coroutine(generator_func))
+    assert is_promise(generator_based_coroutine()) is True
+
+    class CustomAwaitable:
+        def __await__(self) -> Generator[None, None, None]:
+            yield
+
+    custom_awaitable: PromiseOrValue[None] = CustomAwaitable()
+    assert is_promise(custom_awaitable) is True
+
+    future: PromiseOrValue[None] = asyncio.get_running_loop().create_future()
+    assert is_promise(future) is True
+
+
+def test_should_return_false_for_plain_values() -> None:
+    assert is_promise(None) is False
+    assert is_promise(True) is False
+    assert is_promise(0) is False
+    assert is_promise(0.5) is False
+    assert is_promise('') is False
+    assert is_promise(b'') is False
+    assert is_promise([]) is False
+    assert is_promise(()) is False
+    assert is_promise({}) is False
+    assert is_promise(object()) is False
+
+    async def async_func() -> None:
+        pass
+
+    assert is_promise(async_func) is False
+
+    def generator_func() -> Any:
+        yield
+
+    assert is_promise(generator_func()) is False
+
+
+def test_should_return_true_for_awaitable_subclasses_of_plain_types() -> None:
+    class AwaitableDict(dict):
+        def __await__(self) -> Generator[None, None, None]:
+            yield
+
+    awaitable_dict: PromiseOrValue[None] = AwaitableDict()
+    assert is_promise(awaitable_dict) is True
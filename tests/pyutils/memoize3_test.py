@@ -0,0 +1,60 @@
+# Notice: These tests are not transformed from graphql-js
+
+import gc
+import weakref
+
+from atgql.pyutils.memoize3 import memoize3
+
+
+class Key:
+    ...
+
+
+def test_memoizes_by_all_three_arguments():
+    calls: list[tuple[Key, Key, Key]] = []
+
+    @memoize3
+    def fn(a1: Key, a2: Key, a3: Key) -> tuple[Key, Key, Key]:
+        calls.append((a1, a2, a3))
+        return (a1, a2, a3)
+
+    a, b, c = Key(), Key(), Key()
+
+    result = fn(a, b, c)
+    assert result == (a, b, c)
+    assert fn(a, b, c) is result
+    assert len(calls) == 1
+
+    assert fn(a, b, a) == (a, b, a)
+    assert fn(a, c, c) == (a, c, c)
+    assert fn(b, b, c) == (b, b, c)
+    assert len(calls) == 4
+
+
+def test_memoizes_none_results():
+    calls = 0
+
+    @memoize3
+    def fn(unused_a1: Key, unused_a2: Key, unused_a3: Key) -> None:
+        nonlocal calls
+        calls += 1
+
+    a = Key()
+
+    assert fn(a, a, a) is None
+    assert fn(a, a, a) is None
+    assert calls == 1
+
+
+def test_does_not_keep_arguments_alive():
+    @memoize3
+    def fn(unused_a1: Key, unused_a2: Key, unused_a3: Key) -> int:
+        return 1
+
+    a, b, c = Key(), Key(), Key()
+    fn(a, b, c)
+
+    ref = weakref.ref(a)
+    del a
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,30 @@
+from atgql.pyutils.path import Path, add_path, path_to_array
+
+
+def test_can_create_a_path():
+    first = add_path(None, 1, 'First')
+
+    assert first == Path(prev=None, key=1, typename='First')
+
+
+def test_can_add_a_new_key_to_an_existing_path():
+    first = add_path(None, 1, 'First')
+    second = add_path(first, 'two', 'Second')
+
+    assert second == Path(prev=first, key='two', typename='Second')
+
+
+def test_can_convert_a_path_to_an_array_of_its_keys():
+    root = add_path(None, 0, 'Root')
+    first = add_path(root, 'one', 'First')
+    second = add_path(first, 2, 'Second')
+
+    path = path_to_array(second)
+    assert path == [0, 'one', 2]
+
+
+# Notice: This test is not transformed from graphql-js
+def test_does_not_allocate_an_instance_dict():
+    path = add_path(None, 'field', None)
+
+    assert not hasattr(path, '__dict__')
@@ -0,0 +1,89 @@
+# Notice: These tests are not transformed from graphql-js
+
+import asyncio
+
+import pytest
+
+from atgql.pyutils.obj_map import ObjMap
+from atgql.pyutils.promise_for_object import promise_for_object
+from atgql.shims import Promise
+
+
+@pytest.mark.asyncio
+async def test_resolves_all_values_preserving_keys() -> None:
+    async def resolve(value: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        return value
+
+    result = await promise_for_object(
+        {'a': resolve(1, 0.02), 'b': resolve(2, 0), 'c': resolve(3, 0.01)}
+    )
+    assert result == {'a': 1, 'b': 2, 'c': 3}
+    assert list(result) == ['a', 'b', 'c']
+
+
+@pytest.mark.asyncio
+async def test_resolves_empty_object() -> None:
+    empty: ObjMap[Promise[int]] = {}
+    assert await promise_for_object(empty) == {}
+
+
+@pytest.mark.asyncio
+async def test_cancels_pending_values_when_one_fails() -> None:
+    cancelled: list[str] = []
+
+    async def slow() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append('slow')
+            raise
+        return 1
+
+    async def fail() -> int:
+        raise Exception('Oops!')
+
+    with pytest.raises(Exception, match='Oops!'):
+        await promise_for_object({'slow': slow(), 'fail': fail()})
+
+    await asyncio.sleep(0)
+    assert cancelled == ['slow']
+
+
+@pytest.mark.asyncio
+async def test_cancels_pending_values_when_abandoned() -> None:
+    cancelled: list[str] = []
+
+    async def slow(key: str) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(key)
+            raise
+        return 1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(promise_for_object({'a': slow('a'), 'b': slow('b')}), 0.01)
+
+    await asyncio.sleep(0)
+    assert sorted(cancelled) == ['a', 'b']
+
+
+@pytest.mark.asyncio
+async def test_does_not_cancel_futures_shared_with_other_calls() -> None:
+    shared: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+
+    async def fail() -> int:
+        raise Exception('Oops!')
+
+    other = asyncio.ensure_future(promise_for_object({'shared': shared}))
+
+    with pytest.raises(Exception, match='Oops!'):
+        await promise_for_object({'shared': shared, 'fail': fail()})
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(promise_for_object({'shared': shared}), 0.01)
+
+    assert not shared.cancelled()
+    shared.set_result(1)
+    assert await other == {'shared': 1}
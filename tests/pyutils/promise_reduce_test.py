@@ -0,0 +1,45 @@
+# Notice: These tests are not transformed from graphql-js
+
+import pytest
+
+from atgql.pyutils.is_promise import is_promise
+from atgql.pyutils.promise_or_value import PromiseOrValue
+from atgql.pyutils.promise_reduce import promise_reduce
+
+
+def test_returns_plain_value_when_callback_never_returns_a_promise() -> None:
+    result = promise_reduce([1, 2, 3], lambda acc, value: acc + value, 0)
+
+    assert is_promise(result) is False
+    assert result == 6
+
+
+def test_returns_initial_value_for_empty_values() -> None:
+    initial_value: list = []
+
+    assert promise_reduce([], lambda acc, value: acc, initial_value) is initial_value
+
+
+@pytest.mark.asyncio
+async def test_continues_after_a_promise_is_returned() -> None:
+    async def add_async(acc: int, value: int) -> int:
+        return acc + value
+
+    def callback(acc: int, value: int) -> PromiseOrValue[int]:
+        return add_async(acc, value) if value == 2 else acc + value
+
+    result = promise_reduce([1, 2, 3], callback, 0)
+
+    assert is_promise(result)
+    assert await result == 6
+
+
+@pytest.mark.asyncio
+async def test_accepts_a_promise_as_initial_value() -> None:
+    async def initial() -> int:
+        return 10
+
+    result = promise_reduce([1, 2], lambda acc, value: acc + value, initial())
+
+    assert is_promise(result)
+    assert await result == 13
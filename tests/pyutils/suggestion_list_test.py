@@ -1,4 +1,4 @@
-from atgql.pyutils.suggestion_list import suggestion_list
+from atgql.pyutils.suggestion_list import LexicalDistance, suggestion_list
 
 
 def test_returns_when_input_is_empty():
@@ -41,3 +41,10 @@ def test_returns_options_sorted_based_on_lexical_distance():
 
 def test_returns_options_with_same_lexical_distance_sorted_lexicographically():
     assert suggestion_list('a', ['az', 'ax', 'ay']) == ['ax', 'ay', 'az']
+
+
+def test_rejects_options_with_larger_length_difference_than_threshold():
+    assert suggestion_list('abc', ['abcdefgh']) == []
+
+    lexical_distance = LexicalDistance('abc')
+    assert lexical_distance.measure('abcdefgh', 2) is None